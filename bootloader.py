@@ -11,6 +11,7 @@ Usage:
     python3 bootloader.py --plan       # Generate plan without executing
     python3 bootloader.py --execute    # Execute with confirmation
     python3 bootloader.py --execute --dry-run  # Preview execution
+    python3 bootloader.py --execute --move-source  # Move files out of this checkout
 """
 
 import argparse
@@ -20,6 +21,7 @@ import shutil
 import subprocess
 from dataclasses import dataclass, field
 from datetime import datetime
+from os.path import exists as _exists, isdir as _isdir, isfile as _isfile
 from pathlib import Path
 from typing import Optional
 
@@ -56,6 +58,7 @@ class EnvironmentSurvey:
     """Results of surveying the target environment."""
     workspace_root: Path = field(default_factory=lambda: Path("/home/workspace"))
     existing_skills: list = field(default_factory=list)
+    skill_paths: dict = field(default_factory=dict)
     existing_folders: dict = field(default_factory=dict)
     existing_agents: list = field(default_factory=list)
     conventions: dict = field(default_factory=dict)
@@ -72,49 +75,55 @@ class EnvironmentSurveyor:
     
     def run_survey(self) -> EnvironmentSurvey:
         """Run complete environment survey."""
-        self._survey_skills()
-        self._survey_folders()
-        self._survey_conventions()
-        self._detect_conflicts()
+        # One listing of the workspace root feeds every check below
+        try:
+            with os.scandir(self.workspace) as it:
+                root = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            root = {}
+        
+        self._survey_skills(root.get("Skills"))
+        self._survey_folders(root)
+        self._survey_conventions(root)
+        self._detect_conflicts(root)
         self._generate_recommendations()
         return self.survey
     
-    def _survey_skills(self):
+    def _survey_skills(self, skills_entry: Optional[os.DirEntry]):
         """Find existing skills."""
-        skills_dir = self.workspace / "Skills"
-        if skills_dir.exists():
-            for item in skills_dir.iterdir():
-                if item.is_dir() and (item / "SKILL.md").exists():
+        if skills_entry is None or not skills_entry.is_dir():
+            return
+        with os.scandir(skills_entry.path) as it:
+            for item in it:
+                if item.is_dir() and _isfile(os.path.join(item.path, "SKILL.md")):
                     self.survey.existing_skills.append(item.name)
+                    self.survey.skill_paths[item.name] = item.path
     
-    def _survey_folders(self):
+    def _survey_folders(self, root: dict):
         """Map existing folder structure."""
         key_folders = ["Personal", "Documents", "Projects", "Datasets", "Records", "Knowledge"]
         for folder in key_folders:
-            path = self.workspace / folder
-            if path.exists():
+            entry = root.get(folder)
+            if entry is not None and entry.is_dir():
                 self.survey.existing_folders[folder] = True
                 # Check for meetings-related folders
                 if folder == "Personal":
-                    meetings = path / "Meetings"
-                    if meetings.exists():
+                    if _isdir(os.path.join(entry.path, "Meetings")):
                         self.survey.existing_folders["Personal/Meetings"] = True
     
-    def _survey_conventions(self):
+    def _survey_conventions(self, root: dict):
         """Detect naming conventions and patterns."""
         self.survey.conventions["date_format"] = "YYYY-MM-DD"
         
         # Check for AGENTS.md
-        agents_md = self.workspace / "AGENTS.md"
-        self.survey.conventions["has_agents_md"] = agents_md.exists()
+        self.survey.conventions["has_agents_md"] = "AGENTS.md" in root
         
         # Check for N5 system
-        n5_dir = self.workspace / "N5"
-        self.survey.conventions["has_n5"] = n5_dir.exists()
+        self.survey.conventions["has_n5"] = "N5" in root
     
-    def _detect_conflicts(self):
+    def _detect_conflicts(self, root: dict):
         """Detect potential conflicts with existing systems."""
-        if SKILL_NAME in self.survey.existing_skills:
+        if SKILL_NAME in self.survey.skill_paths:
             self.survey.conflicts.append({
                 "type": "skill_exists",
                 "message": f"Skill '{SKILL_NAME}' already exists",
@@ -124,9 +133,10 @@ class EnvironmentSurveyor:
         
         for path_key, path_info in REQUIRED_PATHS.items():
             default_path = path_info.get("default", "")
-            if default_path:
+            # Only stat nested paths whose top-level folder is actually there
+            if default_path and default_path.split("/", 1)[0] in root:
                 full_path = self.workspace / default_path
-                if full_path.exists():
+                if _exists(full_path):
                     self.survey.conflicts.append({
                         "type": "path_exists", 
                         "message": f"Path '{full_path}' already exists",
@@ -162,7 +172,7 @@ class InstallationPlanner:
         """Generate installation plan."""
         skill_dir = self.survey.workspace_root / "Skills" / SKILL_NAME
         
-        if SKILL_NAME in self.survey.existing_skills:
+        if SKILL_NAME in self.survey.skill_paths:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_path = skill_dir.parent / f"{SKILL_NAME}.backup.{timestamp}"
             self.plan["steps"].append({
@@ -196,12 +206,29 @@ class InstallationPlanner:
         return self.plan
 
 
+def _snapshot_tree(source: str, dest: str):
+    """
+    Copy a tree for rollback, hardlinking files where the filesystem allows.
+
+    Backups are read-only snapshots. Install replaces the skill by unlinking
+    (rmtree/rename), never by editing files in place, so shared inodes keep
+    the backup intact.
+    """
+    try:
+        shutil.copytree(source, dest, copy_function=os.link)
+    except (OSError, shutil.Error):
+        # Cross-device or no hardlink support: fall back to a byte copy
+        shutil.rmtree(dest, ignore_errors=True)
+        shutil.copytree(source, dest)
+
+
 class Installer:
     """Executes installation plan."""
     
-    def __init__(self, plan: dict, workspace: Path):
+    def __init__(self, plan: dict, workspace: Path, move_source: bool = False):
         self.plan = plan
         self.workspace = workspace
+        self.move_source = move_source
         self.record = {"installed_at": None, "steps_completed": [], "rollback_info": {}}
     
     def execute(self, dry_run: bool = False):
@@ -219,26 +246,52 @@ class Installer:
             
             try:
                 if step["action"] == "backup":
-                    shutil.copytree(step["source"], step["dest"])
+                    _snapshot_tree(step["source"], step["dest"])
                     print(f"   ✓ Backed up to {step['dest']}")
                 
                 elif step["action"] == "install":
                     source = Path(step["source"])
                     dest = Path(step["dest"])
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    
+                    if not (source / "SKILL.md").is_file():
+                        raise FileNotFoundError(f"{source} has no SKILL.md to install")
                     
-                    if dest.exists():
-                        shutil.rmtree(dest)
+                    # Assemble next to dest, then swap it in with one rename
+                    staging = dest.parent / f".{SKILL_NAME}.staging.{os.getpid()}"
+                    if staging.exists():
+                        shutil.rmtree(staging)
+                    staging.mkdir()
                     
-                    dest.mkdir(parents=True, exist_ok=True)
-                    for item in source.iterdir():
-                        if item.name in ["bootloader.py", ".git", "__pycache__"]:
-                            continue
-                        if item.is_dir():
-                            shutil.copytree(item, dest / item.name)
-                        else:
-                            shutil.copy2(item, dest / item.name)
+                    # Opt-in, same filesystem only: relink inodes instead of copying bytes
+                    move = (self.move_source
+                            and os.stat(source).st_dev == os.stat(dest.parent).st_dev)
+                    moved = []
+                    try:
+                        for item in source.iterdir():
+                            if item.name in ["bootloader.py", ".git", "__pycache__"]:
+                                continue
+                            target = staging / item.name
+                            if move:
+                                os.rename(item, target)
+                                moved.append((target, item))
+                            elif item.is_dir():
+                                shutil.copytree(item, target)
+                            else:
+                                shutil.copy2(item, target)
+                        
+                        if dest.exists():
+                            shutil.rmtree(dest)
+                        os.rename(staging, dest)
+                    except BaseException:
+                        # Put moved files back before discarding the staging dir
+                        for target, item in reversed(moved):
+                            os.rename(target, item)
+                        shutil.rmtree(staging, ignore_errors=True)
+                        raise
                     
-                    print(f"   ✓ Installed to {dest}")
+                    verb = "Moved" if move else "Installed"
+                    print(f"   ✓ {verb} to {dest}")
                 
                 elif step["action"] == "create_config":
                     skill_dir = self.workspace / "Skills" / SKILL_NAME
@@ -326,6 +379,8 @@ def main():
                        help="Execute installation")
     parser.add_argument("--dry-run", action="store_true",
                        help="Preview what would happen")
+    parser.add_argument("--move-source", action="store_true",
+                       help="Move files out of this checkout instead of copying them")
     parser.add_argument("--json", action="store_true",
                        help="Output as JSON")
     
@@ -379,7 +434,7 @@ def main():
                 print("Installation cancelled.")
                 return
     
-    installer = Installer(plan, workspace)
+    installer = Installer(plan, workspace, move_source=args.move_source)
     installer.execute(dry_run=args.dry_run)
 
 
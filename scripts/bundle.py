@@ -8,28 +8,128 @@ Validates received bundles before installation.
 
 import argparse
 import hashlib
-import json
+import io
+import os
+import shutil
+import subprocess
 import sys
 import tarfile
-import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from config import (
-    WORKSPACE_ROOT, compute_checksum, discover_skills,
-    get_workspace_git_sha, load_config, now_iso,
+    CHECKSUM_CHUNK_SIZE, WORKSPACE_ROOT, compute_checksum, discover_skills,
+    get_workspace_git_sha, json_dumps, json_loads, load_config, now_iso,
 )
 
-SKIP_PATTERNS = {"__pycache__", ".git", ".pyc", "node_modules", ".DS_Store"}
+try:
+    from isal import igzip  # optional: ISA-L accelerated gzip
+except ImportError:
+    igzip = None
+
+# Directories pruned whole (a .git file, as in worktrees, is skipped too).
+SKIP_DIR_NAMES = frozenset({"__pycache__", ".git", "node_modules"})
+SKIP_FILE_NAMES = frozenset({".DS_Store"})
+SKIP_SUFFIXES = (".pyc",)
+
+# Below this many files a thread pool costs more than it saves.
+PARALLEL_HASH_MIN_FILES = 4
+
+# Bundles are short-lived transport artifacts, not archives: fast deflate wins
+# over the few percent level 9 would save on text-heavy skills.
+DEFAULT_COMPRESSLEVEL = 1
+
+
+class _HashingReader:
+    """File wrapper that feeds every chunk read through a hasher."""
+
+    def __init__(self, f, hasher):
+        self._f = f
+        self._hasher = hasher
+
+    def read(self, n: int = -1) -> bytes:
+        buf = self._f.read(n)
+        self._hasher.update(buf)
+        return buf
+
+
+def _iter_files(root: Path, skip_dirs: frozenset = SKIP_DIR_NAMES) -> Iterator[str]:
+    """Walk a directory tree with os.scandir, yielding file path strings."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                name = entry.name
+                if name in skip_dirs:
+                    continue
+                # Don't descend into symlinked dirs, but keep symlinked files
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (entry.is_file()
+                        and name not in SKIP_FILE_NAMES
+                        and not name.endswith(SKIP_SUFFIXES)):
+                    yield entry.path
 
 
 def collect_files(skill_path: Path) -> List[Path]:
     """Collect all files in a skill directory, skipping junk."""
-    files = []
-    for item in skill_path.rglob("*"):
-        if item.is_file() and not any(p in str(item) for p in SKIP_PATTERNS):
-            files.append(item)
-    return sorted(files)
+    # Sort plain strings (C comparisons); build Paths only for the result.
+    return [Path(p) for p in sorted(_iter_files(skill_path))]
+
+
+@contextmanager
+def _open_bundle_tar(
+    final_path: Path,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+) -> Iterator[tarfile.TarFile]:
+    """
+    Open a gzipped tarball for streaming writes.
+
+    Compression goes through pigz (parallel gzip) when it is on PATH, then
+    ISA-L's igzip when the isal package is installed, and finally through
+    tarfile's own single-threaded gzip.
+    """
+    pigz = shutil.which("pigz")
+    try:
+        if pigz:
+            with open(final_path, "wb") as out:
+                proc = subprocess.Popen(
+                    [pigz, f"-{compresslevel}", "-p", str(os.cpu_count() or 1), "-c"],
+                    stdin=subprocess.PIPE, stdout=out,
+                )
+            try:
+                with tarfile.open(
+                    fileobj=proc.stdin, mode="w|", copybufsize=CHECKSUM_CHUNK_SIZE,
+                ) as tar:
+                    yield tar
+            finally:
+                proc.stdin.close()
+                code = proc.wait()
+            if code != 0:
+                raise OSError(f"pigz exited with status {code}")
+        elif igzip is not None:
+            # ISA-L only has levels 0-3.
+            with igzip.IGzipFile(final_path, "wb", compresslevel=min(compresslevel, 3)) as gz:
+                with tarfile.open(fileobj=gz, mode="w|", copybufsize=CHECKSUM_CHUNK_SIZE) as tar:
+                    yield tar
+        else:
+            with tarfile.open(
+                final_path, "w:gz", compresslevel=compresslevel, copybufsize=CHECKSUM_CHUNK_SIZE,
+            ) as tar:
+                yield tar
+    except BaseException:
+        # Never leave a truncated bundle behind
+        final_path.unlink(missing_ok=True)
+        raise
+
+
+def _relative_names(skill_path: Path, files: List[Path]) -> List[str]:
+    """Paths of files relative to skill_path, by prefix slicing instead of relative_to."""
+    prefix_len = len(str(skill_path) + os.sep)
+    return [str(f)[prefix_len:].replace(os.sep, "/") for f in files]
 
 
 def create_metadata(
@@ -39,15 +139,25 @@ def create_metadata(
     identity_name: str,
     version: str = "1.0.0",
     notes: str = "",
+    with_checksums: bool = True,
 ) -> Dict:
-    """Create metadata.json content for a skill bundle."""
+    """
+    Create metadata.json content for a skill bundle.
+
+    With with_checksums=False the checksums dict is left empty for the
+    caller to fill while streaming the files (see create_bundle).
+    """
+    file_list = _relative_names(skill_path, files)
     checksums = {}
-    file_list = []
 
-    for f in files:
-        rel = str(f.relative_to(skill_path))
-        file_list.append(rel)
-        checksums[rel] = compute_checksum(f)
+    if with_checksums:
+        if len(files) < PARALLEL_HASH_MIN_FILES:
+            digests = [compute_checksum(f) for f in files]
+        else:
+            # hashlib releases the GIL while hashing, so threads scale across cores.
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+                digests = list(ex.map(compute_checksum, files))
+        checksums = dict(zip(file_list, digests))
 
     return {
         "schema_version": "1.0",
@@ -69,6 +179,7 @@ def create_bundle(
     version: str = "1.0.0",
     notes: str = "",
     dry_run: bool = False,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
 ) -> Dict:
     """
     Create a skill bundle tarball.
@@ -86,7 +197,10 @@ def create_bundle(
     if not files:
         raise ValueError(f"No files found in skill: {skill_path}")
 
-    metadata = create_metadata(skill_name, skill_path, files, identity_name, version, notes)
+    metadata = create_metadata(
+        skill_name, skill_path, files, identity_name, version, notes,
+        with_checksums=dry_run,
+    )
 
     if dry_run:
         return {
@@ -103,14 +217,27 @@ def create_bundle(
     output_dir.mkdir(parents=True, exist_ok=True)
     final_path = output_dir / tarball_name
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        meta_path = Path(tmpdir) / "metadata.json"
-        meta_path.write_text(json.dumps(metadata, indent=2))
-
-        with tarfile.open(final_path, "w:gz") as tar:
-            for f in files:
-                tar.add(f, arcname=str(f.relative_to(skill_path)))
-            tar.add(meta_path, arcname="metadata.json")
+    # Each file is read once: the bytes are hashed on their way into the tar.
+    checksums = metadata["checksums"]
+    with _open_bundle_tar(final_path, compresslevel) as tar:
+        for f, rel in zip(files, metadata["files"]):
+            tarinfo = tar.gettarinfo(str(f), arcname=rel)
+            if not tarinfo.isreg():
+                # Symlinks are archived as links; checksum the target's bytes.
+                tar.addfile(tarinfo)
+                checksums[rel] = compute_checksum(f)
+                continue
+            h = hashlib.sha256()
+            with open(f, "rb") as src:
+                tar.addfile(tarinfo, _HashingReader(src, h))
+            checksums[rel] = f"sha256:{h.hexdigest()}"
+
+        meta_bytes = json_dumps(metadata)
+        meta_info = tarfile.TarInfo("metadata.json")
+        meta_info.size = len(meta_bytes)
+        meta_info.mtime = int(time.time())
+        meta_info.mode = 0o644
+        tar.addfile(meta_info, io.BytesIO(meta_bytes))
 
     bundle_checksum = compute_checksum(final_path)
 
@@ -140,14 +267,25 @@ def validate_bundle(bundle_path: Path) -> Dict:
 
     try:
         with tarfile.open(bundle_path, "r:gz") as tar:
-            members = tar.getnames()
-
-            if "metadata.json" not in members:
+            meta_member = None
+            has_skill_md = False
+            dangerous = []
+
+            for member in tar:
+                name = member.name
+                if name == "metadata.json":
+                    meta_member = member
+                elif name == "SKILL.md":
+                    has_skill_md = True
+                if name.startswith("/") or ".." in name.split("/"):
+                    dangerous.append(f"Dangerous path in archive: {name}")
+
+            if meta_member is None:
                 errors.append("Missing metadata.json in bundle")
             else:
-                meta_file = tar.extractfile("metadata.json")
+                meta_file = tar.extractfile(meta_member)
                 if meta_file:
-                    metadata = json.loads(meta_file.read().decode("utf-8"))
+                    metadata = json_loads(meta_file.read())
                     skill_name = metadata.get("name")
 
                     if not skill_name:
@@ -157,12 +295,10 @@ def validate_bundle(bundle_path: Path) -> Dict:
                     if not metadata.get("checksums"):
                         warnings.append("No checksums in metadata — cannot verify integrity")
 
-            if "SKILL.md" not in members:
+            if not has_skill_md:
                 warnings.append("No SKILL.md in bundle root")
 
-            for member in members:
-                if member.startswith("/") or ".." in member:
-                    errors.append(f"Dangerous path in archive: {member}")
+            errors.extend(dangerous)
 
     except tarfile.TarError as e:
         errors.append(f"Invalid tarball: {e}")
@@ -187,6 +323,8 @@ def main():
     c.add_argument("--version", default="1.0.0")
     c.add_argument("--notes", default="")
     c.add_argument("--dry-run", action="store_true")
+    c.add_argument("--compresslevel", type=int, choices=range(1, 10), default=DEFAULT_COMPRESSLEVEL,
+                   metavar="1-9", help="gzip level (default: 1, bundles are transient)")
 
     v = sub.add_parser("validate", help="Validate a skill bundle")
     v.add_argument("path", help="Path to bundle .tar.gz")
@@ -205,8 +343,9 @@ def main():
                 args.version,
                 args.notes,
                 args.dry_run,
+                args.compresslevel,
             )
-        except (ValueError, FileNotFoundError) as e:
+        except (ValueError, OSError) as e:
             print(f"Error: {e}")
             return 1
         if args.dry_run:
@@ -6,14 +6,19 @@ Loads substrate.yaml from the skill's config directory
 and provides common helpers used across all substrate scripts.
 """
 
+import atexit
+import functools
 import hashlib
 import json
+import mmap
 import os
+import shutil
 import subprocess
 import sys
-from datetime import datetime, timezone
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, List, Optional, Tuple
 
 try:
     import yaml
@@ -21,24 +26,47 @@ except ImportError:
     print("ERROR: PyYAML required. Install with: pip install pyyaml")
     sys.exit(1)
 
+try:
+    import orjson  # optional: faster JSON encoding
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    print("WARNING: PyYAML built without LibYAML; config parsing will be slow. "
+          "Reinstall with libyaml available (pip install --force-reinstall pyyaml).",
+          file=sys.stderr)
+
 
 WORKSPACE_ROOT = Path(os.environ.get("ZO_WORKSPACE", "/home/workspace"))
 SKILL_DIR = Path(__file__).resolve().parent.parent
 CONFIG_FILE = SKILL_DIR / "config" / "substrate.yaml"
 CONFIG_EXAMPLE = SKILL_DIR / "config" / "substrate.yaml.example"
 
+# hashlib releases the GIL for large buffers; big chunks amortize the Python loop.
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
 
 def load_config() -> Dict[str, Any]:
-    """Load and validate substrate configuration."""
-    if not CONFIG_FILE.exists():
+    """Load and validate substrate configuration (cached until the file changes)."""
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Config not found: {CONFIG_FILE}\n"
             f"Copy the example and customize:\n"
             f"  cp {CONFIG_EXAMPLE} {CONFIG_FILE}"
-        )
+        ) from None
+    return _load_config_cached(mtime_ns)
+
 
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(mtime_ns: int) -> Dict[str, Any]:
+    """Parse substrate.yaml; keyed on its mtime so edits invalidate the cache."""
     with open(CONFIG_FILE) as f:
-        cfg = yaml.safe_load(f) or {}
+        cfg = yaml.load(f, Loader=_SafeLoader) or {}
 
     errors = []
     if not cfg.get("identity", {}).get("name"):
@@ -66,6 +94,46 @@ def load_config() -> Dict[str, Any]:
     return cfg
 
 
+class OutputBuffer:
+    """Collects status lines and writes them to stdout in one call per flush."""
+
+    def __init__(self):
+        self._lines: List[str] = []
+        atexit.register(self.flush)
+
+    def add(self, line: str) -> None:
+        self._lines.append(line)
+
+    def flush(self) -> None:
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
+
+
+def json_dumps(obj: Any, default=None) -> bytes:
+    """Encode obj as indented UTF-8 JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False).encode("utf-8")
+
+
+# Chosen once at import; both accept bytes without a separate decode step.
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode JSON from raw bytes, via orjson when available."""
+    return _loads(data)
+
+
+def write_json_atomic(path: Path, obj: Any, default=None) -> None:
+    """Write JSON via a sibling temp file so readers never see a torn file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(json_dumps(obj, default=default))
+    os.replace(tmp, path)
+
+
 def state_dir(cfg: Dict) -> Path:
     """Get the state directory path, creating it if needed."""
     d = WORKSPACE_ROOT / cfg["state"]["dir"]
@@ -73,21 +141,77 @@ def state_dir(cfg: Dict) -> Path:
     return d
 
 
+# Parsed state files keyed by (path, mtime_ns, size); external writes change the key.
+_STATE_CACHE: Dict[Tuple[str, int, int], Dict] = {}
+
+
 def load_state(cfg: Dict, filename: str) -> Dict:
-    """Load a JSON state file."""
-    p = state_dir(cfg) / filename
-    if p.exists():
-        try:
-            return json.loads(p.read_text())
-        except Exception:
-            return {}
-    return {}
+    """Load a JSON state file (cached per process; treat the result as read-only)."""
+    return _load_state_file(state_dir(cfg) / filename)
+
+
+def load_states(cfg: Dict, filenames: List[str]) -> Dict[str, Dict]:
+    """Load several state files at once, resolving the state dir only once."""
+    d = state_dir(cfg)
+    return {name: _load_state_file(d / name) for name in filenames}
+
+
+def _load_state_file(p: Path) -> Dict:
+    try:
+        st = os.stat(p)
+    except FileNotFoundError:
+        return {}
+
+    key = (str(p), st.st_mtime_ns, st.st_size)
+    hit = _STATE_CACHE.get(key)
+    if hit is not None:
+        return hit
+    try:
+        data = json_loads(p.read_bytes())
+    except Exception:
+        data = {}
+    _STATE_CACHE[key] = data
+    return data
 
 
 def save_state(cfg: Dict, filename: str, data: Dict) -> None:
     """Save a JSON state file."""
     p = state_dir(cfg) / filename
-    p.write_text(json.dumps(data, indent=2, default=str))
+    path = str(p)
+    for key in [k for k in _STATE_CACHE if k[0] == path]:
+        del _STATE_CACHE[key]
+    write_json_atomic(p, data, default=str)
+
+
+# Junk never copied between a workspace and the substrate repo
+COPY_SKIP_NAMES = frozenset({"__pycache__", ".git", "node_modules", ".DS_Store"})
+COPY_SKIP_SUFFIXES = (".pyc", ".pyo")
+
+
+def ignore_junk(directory: str, contents: List[str]) -> List[str]:
+    """copytree ignore callback for COPY_SKIP_NAMES / COPY_SKIP_SUFFIXES."""
+    return [c for c in contents if c in COPY_SKIP_NAMES or c.endswith(COPY_SKIP_SUFFIXES)]
+
+
+def link_or_copy(src: str, dst: str, *, follow_symlinks: bool = True) -> str:
+    """
+    copytree copy_function: hardlink when possible, else copy2.
+
+    Hardlinks cost no data I/O; cross-device or unsupported links fall back.
+    """
+    try:
+        os.link(src, dst, follow_symlinks=follow_symlinks)
+    except OSError:
+        shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
+_WS_TRANS = str.maketrans("", "", " \t\r\n")
+
+
+def parse_skill_list(value: Optional[str]) -> Optional[List[str]]:
+    """Split a --skills "a, b" argument into slugs; None when not given."""
+    return value.translate(_WS_TRANS).split(",") if value else None
 
 
 def repo_url(cfg: Dict) -> str:
@@ -108,29 +232,53 @@ def tmp_repo_path(cfg: Dict) -> Path:
     return Path(f"/tmp/zo-substrate-{name}")
 
 
+def _decode(output: Optional[bytes]) -> str:
+    """Decode captured subprocess output once, tolerating bad UTF-8."""
+    return output.decode("utf-8", "replace").strip() if output else ""
+
+
 def run_git(cmd: List[str], cwd: Path, check: bool = True) -> Tuple[int, str, str]:
     """Run a git command and return (returncode, stdout, stderr)."""
     try:
-        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=check)
-        return result.returncode, result.stdout.strip(), result.stderr.strip()
+        result = subprocess.run(
+            cmd, cwd=cwd, stdin=subprocess.DEVNULL, capture_output=True, check=check,
+        )
+        return result.returncode, _decode(result.stdout), _decode(result.stderr)
     except subprocess.CalledProcessError as e:
         if check:
             raise
-        return e.returncode, e.stdout.strip() if e.stdout else "", e.stderr.strip() if e.stderr else ""
+        return e.returncode, _decode(e.stdout), _decode(e.stderr)
 
 
 def compute_checksum(filepath: Path) -> str:
     """Compute SHA-256 checksum of a file."""
-    h = hashlib.sha256()
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+        size = os.fstat(f.fileno()).st_size
+        if size > CHECKSUM_CHUNK_SIZE:
+            # Hash the mapping in one C call, no read() copies into Python.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h = hashlib.sha256(mm)
+        elif hasattr(hashlib, "file_digest"):
+            h = hashlib.file_digest(f, "sha256")
+        else:
+            h = hashlib.sha256()
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+                h.update(chunk)
     return f"sha256:{h.hexdigest()}"
 
 
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last now_iso() call
+_iso_second: Tuple[int, str] = (-1, "")
+
+
 def now_iso() -> str:
     """Current UTC timestamp in ISO format."""
-    return datetime.now(timezone.utc).isoformat()
+    global _iso_second
+    t = time.time()
+    secs = int(t)
+    if secs != _iso_second[0]:
+        _iso_second = (secs, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs)))
+    return f"{_iso_second[1]}.{int((t - secs) * 1_000_000):06d}+00:00"
 
 
 def get_workspace_git_sha() -> str:
@@ -138,49 +286,77 @@ def get_workspace_git_sha() -> str:
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
-            cwd=WORKSPACE_ROOT,
-            capture_output=True, text=True, check=True,
+            cwd=WORKSPACE_ROOT, stdin=subprocess.DEVNULL,
+            capture_output=True, check=True,
         )
-        return result.stdout.strip()
+        return _decode(result.stdout)
     except Exception:
         return "unknown"
 
 
+# (key, results) of the last discover_skills scan. The key includes the
+# Skills/ mtime, which changes whenever a skill directory is added or removed.
+_DISCOVER_CACHE: Tuple[tuple, List[Dict[str, Any]]] = ((), [])
+_DISCOVER_LOCK = threading.Lock()
+
+
 def discover_skills(cfg: Dict) -> List[Dict[str, Any]]:
     """
     Discover skills to export based on config.
 
     Returns list of dicts: [{name, path, has_scripts}, ...]
     """
+    global _DISCOVER_CACHE
     skills_dir = WORKSPACE_ROOT / "Skills"
-    if not skills_dir.exists():
+    try:
+        mtime_ns = os.stat(skills_dir).st_mtime_ns
+    except FileNotFoundError:
         return []
 
     explicit = cfg["export"].get("skills", [])
     exclude = set(cfg["export"].get("exclude", []))
     auto = cfg["export"].get("auto_detect", True)
 
+    key = (str(skills_dir), mtime_ns, tuple(explicit), frozenset(exclude), auto)
+    with _DISCOVER_LOCK:
+        if _DISCOVER_CACHE[0] == key:
+            return [dict(s) for s in _DISCOVER_CACHE[1]]
+
+    results = _scan_skills(skills_dir, explicit, exclude, auto)
+    with _DISCOVER_LOCK:
+        _DISCOVER_CACHE = (key, results)
+    return [dict(s) for s in results]
+
+
+def _scan_skills(
+    skills_dir: Path,
+    explicit: List[str],
+    exclude: set,
+    auto: bool,
+) -> List[Dict[str, Any]]:
+    """Walk Skills/ for discover_skills."""
     results = []
 
     if explicit:
-        candidates = [(skills_dir / s) for s in explicit]
+        candidates = [skills_dir / s for s in explicit if s not in exclude]
+        candidates = [p for p in candidates if os.path.isdir(p)]
     elif auto:
-        candidates = [d for d in skills_dir.iterdir() if d.is_dir()]
+        # DirEntry.is_dir() is answered from the directory listing itself.
+        with os.scandir(skills_dir) as it:
+            candidates = [Path(e.path) for e in it if e.is_dir() and e.name not in exclude]
     else:
         return []
 
     for skill_path in candidates:
-        if not skill_path.is_dir():
-            continue
         name = skill_path.name
-        if name in exclude:
-            continue
-        skill_md = skill_path / "SKILL.md"
-        if not skill_md.exists():
+        if not os.path.isfile(skill_path / "SKILL.md"):
             continue
 
-        scripts_dir = skill_path / "scripts"
-        has_scripts = scripts_dir.exists() and any(scripts_dir.iterdir())
+        try:
+            with os.scandir(skill_path / "scripts") as it:
+                has_scripts = next(it, None) is not None
+        except (FileNotFoundError, NotADirectoryError):
+            has_scripts = False
 
         results.append({
             "name": name,
@@ -192,9 +368,37 @@ def discover_skills(cfg: Dict) -> List[Dict[str, Any]]:
     return results
 
 
+_log_fp: Optional[IO[str]] = None
+_log_path: Optional[Path] = None
+
+
+def _close_log() -> None:
+    """Flush and close the shared log handle."""
+    global _log_fp, _log_path
+    if _log_fp is not None:
+        _log_fp.close()
+    _log_fp = None
+    _log_path = None
+
+
+atexit.register(_close_log)
+
+
+def flush_log() -> None:
+    """Force buffered log events to disk (for callers that need durability now)."""
+    if _log_fp is not None:
+        _log_fp.flush()
+
+
 def log_event(cfg: Dict, event: str, details: Optional[Dict] = None) -> None:
-    """Append an event to the substrate log."""
+    """Append an event to the substrate log (buffered; flushed at exit)."""
+    global _log_fp, _log_path
     log_file = state_dir(cfg) / "substrate.log"
+    if _log_fp is None or _log_path != log_file:
+        _close_log()
+        _log_fp = open(log_file, "a", encoding="utf-8", buffering=8192)
+        _log_path = log_file
+
     entry = {
         "timestamp": now_iso(),
         "event": event,
@@ -202,5 +406,8 @@ def log_event(cfg: Dict, event: str, details: Optional[Dict] = None) -> None:
     }
     if details:
         entry["details"] = details
-    with open(log_file, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    if orjson is not None:
+        line = orjson.dumps(entry).decode()
+    else:
+        line = json.dumps(entry, separators=(",", ":"))
+    _log_fp.write(line + "\n")
@@ -8,11 +8,34 @@ what capabilities it has after pulling from the substrate.
 """
 
 import argparse
-import json
+import itertools
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
-from config import WORKSPACE_ROOT, load_config, now_iso, state_dir
+from config import (
+    WORKSPACE_ROOT, json_dumps, json_loads, load_config, now_iso, state_dir, write_json_atomic,
+)
+
+# Entries read per top-level folder; only the first 10 (by name) are kept.
+FOLDER_SCAN_LIMIT = 200
+
+
+def _frontmatter_name(skill_md: str) -> Optional[str]:
+    """Read `name:` from SKILL.md frontmatter, stopping at the closing `---`."""
+    with open(skill_md, "r", encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            stripped = line.strip()
+            if i == 0:
+                if stripped != "---":
+                    return None
+                continue
+            if stripped == "---":
+                return None
+            if stripped.startswith("name:"):
+                return stripped.split(":", 1)[1].strip().strip("'\"")
+    return None
 
 
 def scan_skills() -> list[dict]:
@@ -22,28 +45,28 @@ def scan_skills() -> list[dict]:
     if not skills_dir.exists():
         return skills
 
-    for d in sorted(skills_dir.iterdir()):
+    with os.scandir(skills_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    for d in entries:
         if not d.is_dir():
             continue
-        skill_md = d / "SKILL.md"
-        if not skill_md.exists():
+        skill_md = os.path.join(d.path, "SKILL.md")
+        if not os.path.exists(skill_md):
             continue
 
         dir_name = d.name
-        frontmatter_name = None
-        content = skill_md.read_text()
-        for line in content.split("\n"):
-            if line.strip().startswith("name:"):
-                frontmatter_name = line.split(":", 1)[1].strip().strip("'\"")
-                break
-
-        entry = {"name": dir_name, "path": str(d.relative_to(WORKSPACE_ROOT)), "scripts": []}
+        frontmatter_name = _frontmatter_name(skill_md)
+
+        entry = {"name": dir_name, "path": str(Path(d.path).relative_to(WORKSPACE_ROOT)), "scripts": []}
         if frontmatter_name and frontmatter_name != dir_name:
             entry["frontmatter_name"] = frontmatter_name
 
-        scripts_dir = d / "scripts"
-        if scripts_dir.exists():
-            entry["scripts"] = [f.name for f in scripts_dir.iterdir() if f.is_file()]
+        try:
+            with os.scandir(os.path.join(d.path, "scripts")) as scripts:
+                entry["scripts"] = [f.name for f in scripts if f.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            pass
 
         skills.append(entry)
 
@@ -53,11 +76,17 @@ def scan_skills() -> list[dict]:
 def scan_folder_structure() -> dict:
     """Get top-level folder structure."""
     structure = {}
-    for item in sorted(WORKSPACE_ROOT.iterdir()):
+    with os.scandir(WORKSPACE_ROOT) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    for item in entries:
         if item.is_dir() and not item.name.startswith("."):
             children = []
             try:
-                for child in sorted(item.iterdir())[:10]:
+                with os.scandir(item.path) as child_it:
+                    child_entries = list(itertools.islice(child_it, FOLDER_SCAN_LIMIT))
+                child_entries.sort(key=lambda e: e.name)
+                for child in child_entries[:10]:
                     children.append(child.name + ("/" if child.is_dir() else ""))
             except PermissionError:
                 pass
@@ -78,20 +107,29 @@ def refresh(cfg: dict) -> dict:
         "folder_structure": structure,
     }
 
-    output = state_dir(cfg) / "context.json"
-    output.write_text(json.dumps(context, indent=2))
+    state = state_dir(cfg)
+    write_json_atomic(state / "context.json", context)
+
+    # Just what `query --what summary` prints, so it needn't parse the full snapshot
+    summary = {key: context[key] for key in ("identity", "last_refresh", "skills")}
+    write_json_atomic(state / "context_summary.json", summary)
     return context
 
 
 def query(cfg: dict, what: str = "summary", detail: bool = False) -> None:
     """Query the current context snapshot."""
-    ctx_file = state_dir(cfg) / "context.json"
-    if not ctx_file.exists():
+    state = state_dir(cfg)
+    ctx_file = state / "context.json"
+    summary_file = state / "context_summary.json"
+
+    if what == "summary" and summary_file.exists():
+        ctx = json_loads(summary_file.read_bytes())
+    elif ctx_file.exists():
+        ctx = json_loads(ctx_file.read_bytes())
+    else:
         print("No context snapshot found. Run: substrate.py context refresh")
         return
 
-    ctx = json.loads(ctx_file.read_text())
-
     if what == "summary":
         print(f"Identity: {ctx.get('identity', '?')}")
         print(f"Last refresh: {ctx.get('last_refresh', '?')}")
@@ -116,7 +154,7 @@ def query(cfg: dict, what: str = "summary", detail: bool = False) -> None:
                 print(f"  - {c}")
 
     elif what == "json":
-        print(json.dumps(ctx, indent=2))
+        print(json_dumps(ctx).decode("utf-8"))
 
 
 def main():
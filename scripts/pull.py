@@ -7,18 +7,23 @@ new/updated skills into the local workspace.
 """
 
 import argparse
-import json
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from config import (
-    WORKSPACE_ROOT, load_config, load_state, log_event,
-    now_iso, repo_url, run_git, save_state, tmp_repo_path,
+    WORKSPACE_ROOT, OutputBuffer, flush_log, ignore_junk, json_loads, link_or_copy,
+    load_config, load_state, log_event, now_iso, parse_skill_list, repo_url, run_git,
+    save_state, tmp_repo_path,
 )
 
+# Per-skill progress lines, written out at phase boundaries
+_out = OutputBuffer()
+
 
 def clone_fresh(cfg: Dict) -> bool:
     """Clone a fresh copy of the substrate repo."""
@@ -30,11 +35,16 @@ def clone_fresh(cfg: Dict) -> bool:
     branch = cfg["substrate"]["branch"]
     print(f"  Cloning {cfg['substrate']['repo']} (branch: {branch})...")
 
+    clone = ["git", "clone", "--branch", branch, "--single-branch"]
     try:
-        run_git(
-            ["git", "clone", "--branch", branch, "--single-branch", url, str(tmp)],
-            cwd=Path("/tmp"),
-        )
+        try:
+            # Pull only reads the tip tree: skip history, fetch blobs lazily
+            run_git(clone + ["--depth", "1", "--filter=blob:none", url, str(tmp)], cwd=Path("/tmp"))
+        except Exception:
+            # Servers without shallow/partial clone support: retry in full
+            if tmp.exists():
+                shutil.rmtree(tmp)
+            run_git(clone + [url, str(tmp)], cwd=Path("/tmp"))
         print("  Clone OK")
         return True
     except Exception as e:
@@ -42,6 +52,18 @@ def clone_fresh(cfg: Dict) -> bool:
         return False
 
 
+def remote_head_sha(cfg: Dict) -> Optional[str]:
+    """Tip sha of the substrate branch via ls-remote (no clone), or None."""
+    branch = cfg["substrate"]["branch"]
+    code, out, _ = run_git(
+        ["git", "ls-remote", repo_url(cfg), f"refs/heads/{branch}"],
+        cwd=Path("/tmp"), check=False,
+    )
+    if code != 0 or not out:
+        return None
+    return out.split()[0]
+
+
 def read_manifest(tmp: Path) -> Optional[Dict]:
     """Read MANIFEST.json from the cloned repo."""
     manifest_path = tmp / "MANIFEST.json"
@@ -50,7 +72,7 @@ def read_manifest(tmp: Path) -> Optional[Dict]:
         return None
 
     try:
-        return json.loads(manifest_path.read_text())
+        return json_loads(manifest_path.read_bytes())
     except Exception as e:
         print(f"  ERROR reading MANIFEST.json: {e}")
         return None
@@ -67,23 +89,25 @@ def detect_changes(
     Returns list of dicts: [{name, reason}, ...]
     """
     last_pull = load_state(cfg, "last_pull.json")
-    last_skills = {s: True for s in last_pull.get("pulled_skills", [])}
+    last_skills = frozenset(last_pull.get("pulled_skills", ()))
     last_sha = last_pull.get("substrate_sha", "")
 
     skills_dir = tmp / "Skills"
     if not skills_dir.exists():
         return []
 
+    # Order is filesystem order; callers sort when presenting.
     changes = []
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
-            continue
-        name = skill_dir.name
+    with os.scandir(skills_dir) as it:
+        for skill_dir in it:
+            if not skill_dir.is_dir():
+                continue
+            name = skill_dir.name
 
-        if name not in last_skills:
-            changes.append({"name": name, "reason": "new"})
-        else:
-            changes.append({"name": name, "reason": "update_check"})
+            if name not in last_skills:
+                changes.append({"name": name, "reason": "new"})
+            else:
+                changes.append({"name": name, "reason": "update_check"})
 
     return changes
 
@@ -94,28 +118,28 @@ def install_skill(
     cfg: Dict,
     backup: bool = True,
 ) -> bool:
-    """Install a skill from the substrate clone into the local workspace."""
+    """
+    Install a skill from the substrate clone into the local workspace.
+
+    The caller creates the install dir and its .backups/ once per pull.
+    """
     install_dir = WORKSPACE_ROOT / cfg["pull"]["install_dir"]
-    install_dir.mkdir(parents=True, exist_ok=True)
     dest = install_dir / skill_name
 
-    skip_patterns = {"__pycache__", ".git", "node_modules", ".DS_Store", ".pyc"}
-
-    def ignore_fn(directory, contents):
-        return [c for c in contents if c in skip_patterns]
-
     if dest.exists() and backup:
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        backup_dir = install_dir / ".backups"
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        backup_path = backup_dir / f"{skill_name}.{ts}"
-        shutil.move(str(dest), str(backup_path))
-        print(f"    Backed up: .backups/{skill_name}.{ts}")
+        backup_path = install_dir / ".backups" / f"{skill_name}.{ts}"
+        try:
+            os.replace(dest, backup_path)
+        except OSError:
+            # e.g. .backups/ on another mount: fall back to copy + delete
+            shutil.move(str(dest), str(backup_path))
+        _out.add(f"    Backed up: .backups/{skill_name}.{ts}")
 
     elif dest.exists():
         shutil.rmtree(dest)
 
-    shutil.copytree(source, dest, ignore=ignore_fn)
+    shutil.copytree(source, dest, ignore=ignore_junk, copy_function=link_or_copy)
     return True
 
 
@@ -134,6 +158,14 @@ def pull(
     print(f"  To: {cfg['identity']['name']}")
     print(f"  Repo: {cfg['substrate']['repo']}")
 
+    if filter_skills is None and not dry_run:
+        last_pull = load_state(cfg, "last_pull.json")
+        remote_sha = remote_head_sha(cfg)
+        if (remote_sha and last_pull.get("complete")
+                and remote_sha == last_pull.get("substrate_sha")):
+            print(f"  Up to date (sha={remote_sha[:12]})")
+            return {"success": True, "installed": [], "up_to_date": True}
+
     tmp = tmp_repo_path(cfg)
 
     try:
@@ -177,15 +209,25 @@ def pull(
 
         installed = []
         backup = cfg["pull"].get("backup_existing", True)
-
-        for name in sorted(to_install):
-            source = skills_dir / name
-            print(f"  Installing: {name}")
-            try:
-                install_skill(name, source, cfg, backup=backup)
-                installed.append(name)
-            except Exception as e:
-                print(f"    FAILED: {e}")
+        install_dir = WORKSPACE_ROOT / cfg["pull"]["install_dir"]
+        (install_dir / ".backups" if backup else install_dir).mkdir(parents=True, exist_ok=True)
+
+        # Each install touches only its own dest, so they can overlap on I/O
+        with ThreadPoolExecutor(max_workers=min(8, len(to_install))) as ex:
+            futures = {
+                ex.submit(install_skill, name, skills_dir / name, cfg, backup): name
+                for name in sorted(to_install)
+            }
+            for fut in as_completed(futures):
+                name = futures[fut]
+                try:
+                    fut.result()
+                    installed.append(name)
+                    _out.add(f"  ✓ {name}")
+                except Exception as e:
+                    _out.add(f"  FAILED {name}: {e}")
+        installed.sort()
+        _out.flush()
 
         get_sha_cmd = ["git", "rev-parse", "HEAD"]
         _, sha, _ = run_git(get_sha_cmd, tmp, check=False)
@@ -194,15 +236,19 @@ def pull(
             "last_pull": now_iso(),
             "pulled_skills": installed,
             "substrate_sha": sha,
+            # Only a full, failure-free pull lets the next one skip the clone
+            "complete": filter_skills is None and len(installed) == len(to_install),
             "source": manifest.get("source", "unknown") if manifest else "unknown",
         }
         save_state(cfg, "last_pull.json", sync_state)
         log_event(cfg, "pull", {"skills": installed})
+        flush_log()
 
         print(f"\n✓ Pull complete: {len(installed)} skills installed")
         return {"success": True, "installed": installed}
 
     finally:
+        _out.flush()
         if tmp.exists():
             shutil.rmtree(tmp)
 
@@ -215,7 +261,7 @@ def main():
     args = parser.parse_args()
 
     cfg = load_config()
-    filter_skills = [s.strip() for s in args.skills.split(",")] if args.skills else None
+    filter_skills = parse_skill_list(args.skills)
     result = pull(cfg, filter_skills=filter_skills, dry_run=args.dry_run, verbose=args.verbose)
     sys.exit(0 if result.get("success") else 1)
 
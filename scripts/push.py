@@ -7,18 +7,20 @@ commits, and pushes. Tracks sync state for incremental updates.
 """
 
 import argparse
-import json
 import shutil
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from config import (
-    WORKSPACE_ROOT, discover_skills, get_workspace_git_sha,
-    load_config, load_state, log_event, now_iso, repo_url,
-    run_git, save_state, tmp_repo_path,
+    WORKSPACE_ROOT, OutputBuffer, discover_skills, flush_log, get_workspace_git_sha,
+    ignore_junk, link_or_copy, load_config, load_state, log_event, now_iso, parse_skill_list,
+    repo_url, run_git, save_state, tmp_repo_path, write_json_atomic,
 )
 
+# Per-skill progress lines, written out at phase boundaries
+_out = OutputBuffer()
+
 
 def clone_fresh(cfg: Dict) -> bool:
     """Clone a fresh copy of the substrate repo."""
@@ -30,11 +32,16 @@ def clone_fresh(cfg: Dict) -> bool:
     branch = cfg["substrate"]["branch"]
     print(f"  Cloning {cfg['substrate']['repo']} (branch: {branch})...")
 
+    clone = ["git", "clone", "--branch", branch, "--single-branch"]
     try:
-        code, out, err = run_git(
-            ["git", "clone", "--branch", branch, "--single-branch", url, str(tmp)],
-            cwd=Path("/tmp"),
-        )
+        try:
+            # Push only needs the tip tree to overwrite and commit on top of
+            run_git(clone + ["--depth", "1", url, str(tmp)], cwd=Path("/tmp"))
+        except Exception:
+            # Servers without shallow clone support: retry in full
+            if tmp.exists():
+                shutil.rmtree(tmp)
+            run_git(clone + [url, str(tmp)], cwd=Path("/tmp"))
         print("  Clone OK")
         return True
     except Exception as e:
@@ -48,26 +55,22 @@ def copy_skills(cfg: Dict, skills: List[Dict], tmp: Path) -> List[str]:
     skills_dir.mkdir(exist_ok=True)
     copied = []
 
-    skip_patterns = {"__pycache__", ".git", "node_modules", ".DS_Store", ".pyc"}
-
-    def ignore_fn(directory, contents):
-        return [c for c in contents if c in skip_patterns]
-
     for skill in skills:
         src = Path(skill["abs_path"])
         dest = skills_dir / skill["name"]
 
         if not src.exists():
-            print(f"  SKIP {skill['name']}: source not found")
+            _out.add(f"  SKIP {skill['name']}: source not found")
             continue
 
         if dest.exists():
             shutil.rmtree(dest)
 
-        shutil.copytree(src, dest, ignore=ignore_fn)
+        shutil.copytree(src, dest, ignore=ignore_junk, copy_function=link_or_copy)
         copied.append(skill["name"])
-        print(f"  Copied: {skill['name']}")
+        _out.add(f"  Copied: {skill['name']}")
 
+    _out.flush()
     return copied
 
 
@@ -82,26 +85,26 @@ def update_manifest(cfg: Dict, copied: List[str], tmp: Path) -> None:
         "skill_count": len(copied),
         "schema_version": "1.0",
     }
-    (tmp / "MANIFEST.json").write_text(json.dumps(manifest, indent=2))
+    write_json_atomic(tmp / "MANIFEST.json", manifest)
 
 
 def commit_and_push(cfg: Dict, copied: List[str], tmp: Path) -> bool:
     """Commit and push changes."""
     identity = cfg["identity"]["name"]
-    run_git(["git", "config", "user.email", f"{identity}@zo.computer"], tmp, check=False)
-    run_git(["git", "config", "user.name", identity], tmp, check=False)
 
-    code, status, _ = run_git(["git", "status", "--porcelain"], tmp)
-    if not status.strip():
+    run_git(["git", "add", "-A"], tmp)
+    code, _, _ = run_git(["git", "diff", "--cached", "--quiet"], tmp, check=False)
+    if code == 0:
         print("  No changes to commit")
         return True
 
-    run_git(["git", "add", "-A"], tmp)
-
     msg = f"Sync from {identity}: {', '.join(copied[:5])}"
     if len(copied) > 5:
         msg += f" (+{len(copied) - 5} more)"
-    run_git(["git", "commit", "-m", msg], tmp)
+    run_git([
+        "git", "-c", f"user.email={identity}@zo.computer", "-c", f"user.name={identity}",
+        "commit", "-m", msg,
+    ], tmp)
 
     branch = cfg["substrate"]["branch"]
     print(f"  Pushing to origin/{branch}...")
@@ -128,11 +131,13 @@ def push(
     print(f"  From: {cfg['identity']['name']}")
     print(f"  Repo: {cfg['substrate']['repo']}")
 
-    skills = discover_skills(cfg)
+    all_skills = discover_skills(cfg)
+    skills = all_skills
     if filter_skills:
-        skills = [s for s in skills if s["name"] in filter_skills]
+        filter_set = set(filter_skills)
+        skills = [s for s in all_skills if s["name"] in filter_set]
         if not skills:
-            available = [s["name"] for s in discover_skills(cfg)]
+            available = [s["name"] for s in all_skills]
             print(f"  ⚠ No matching skills found for filter: {', '.join(filter_skills)}")
             print(f"  Available: {', '.join(available) if available else 'none'}")
             return {"success": False, "copied": [], "error": "no_match"}
@@ -159,6 +164,13 @@ def push(
         if not copied:
             return {"success": True, "copied": [], "note": "nothing_to_copy"}
 
+        # Rewriting MANIFEST.json always changes generated_at, so only do it
+        # when the skill tree itself differs (porcelain also sees new skills).
+        _, changes, _ = run_git(["git", "status", "--porcelain", "--", "Skills/"], tmp)
+        if not changes.strip():
+            print("  No skill changes to push")
+            return {"success": True, "copied": [], "note": "no_changes"}
+
         update_manifest(cfg, copied, tmp)
 
         if not commit_and_push(cfg, copied, tmp):
@@ -171,11 +183,13 @@ def push(
         }
         save_state(cfg, "last_push.json", sync_state)
         log_event(cfg, "push", {"skills": copied})
+        flush_log()
 
         print(f"\n✓ Push complete: {len(copied)} skills synced")
         return {"success": True, "copied": copied}
 
     finally:
+        _out.flush()
         if tmp.exists():
             shutil.rmtree(tmp)
 
@@ -187,7 +201,7 @@ def main():
     args = parser.parse_args()
 
     cfg = load_config()
-    filter_skills = [s.strip() for s in args.skills.split(",")] if args.skills else None
+    filter_skills = parse_skill_list(args.skills)
     result = push(cfg, filter_skills=filter_skills, dry_run=args.dry_run)
     sys.exit(0 if result.get("success") else 1)
 
@@ -11,7 +11,9 @@ import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 try:
     import yaml
@@ -19,30 +21,39 @@ except ImportError:
     print("ERROR: PyYAML required. Install with: pip install pyyaml")
     sys.exit(1)
 
-from config import CONFIG_EXAMPLE, CONFIG_FILE, WORKSPACE_ROOT
+from config import CONFIG_EXAMPLE, CONFIG_FILE, WORKSPACE_ROOT, parse_skill_list
+
+
+def _probe(cmd: list[str]) -> Optional[int]:
+    """Run a command quietly; return its exit code, or None if it can't run."""
+    try:
+        return subprocess.run(cmd, capture_output=True).returncode
+    except Exception:
+        return None
 
 
 def check_prerequisites() -> list[str]:
     """Check that required tools are available."""
     issues = []
 
-    try:
-        subprocess.run(["git", "--version"], capture_output=True, check=True)
-    except Exception:
+    # The probes are independent, so overlap their process startup
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        git = ex.submit(_probe, ["git", "--version"])
+        gh = ex.submit(_probe, ["gh", "--version"])
+        auth = None if os.environ.get("GITHUB_TOKEN") else ex.submit(_probe, ["gh", "auth", "status"])
+
+    if git.result() != 0:
         issues.append("git is not installed or not in PATH")
 
-    try:
-        subprocess.run(["gh", "--version"], capture_output=True, check=True)
-    except Exception:
+    if gh.result() != 0:
         issues.append("GitHub CLI (gh) is not installed — needed for repo creation")
 
-    if not os.environ.get("GITHUB_TOKEN"):
-        try:
-            result = subprocess.run(["gh", "auth", "status"], capture_output=True, text=True)
-            if result.returncode != 0:
-                issues.append("No GITHUB_TOKEN and gh not authenticated — need one or the other")
-        except Exception:
+    if auth is not None:
+        code = auth.result()
+        if code is None:
             issues.append("Cannot verify GitHub authentication")
+        elif code != 0:
+            issues.append("No GITHUB_TOKEN and gh not authenticated — need one or the other")
 
     return issues
 
@@ -199,7 +210,7 @@ def main():
             for i in issues:
                 print(f"  ⚠ {i}")
 
-        skills = [s.strip() for s in args.skills.split(",")] if args.skills else None
+        skills = parse_skill_list(args.skills)
         private = not args.public
 
         if args.create_repo:
@@ -21,121 +21,184 @@ Usage:
 import argparse
 import json
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
+_SCRIPT_DIR_STR = str(SCRIPT_DIR)
+if _SCRIPT_DIR_STR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR_STR)
+
+
+@contextmanager
+def _friendly_errors():
+    """Turn config problems into a one-line message and exit status 1."""
+    try:
+        yield
+    except FileNotFoundError as e:
+        print(f"Config error: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Validation error: {e}")
+        sys.exit(1)
 
 
 def cmd_push(args):
     from push import push
-    from config import load_config
-    cfg = load_config()
-    skills = [s.strip() for s in args.skills.split(",")] if args.skills else None
+    from config import load_config, parse_skill_list
+    with _friendly_errors():
+        cfg = load_config()
+    skills = parse_skill_list(args.skills)
     result = push(cfg, filter_skills=skills, dry_run=args.dry_run)
     return 0 if result.get("success") else 1
 
 
 def cmd_pull(args):
     from pull import pull
-    from config import load_config
-    cfg = load_config()
-    skills = [s.strip() for s in args.skills.split(",")] if args.skills else None
+    from config import load_config, parse_skill_list
+    with _friendly_errors():
+        cfg = load_config()
+    skills = parse_skill_list(args.skills)
     result = pull(cfg, filter_skills=skills, dry_run=args.dry_run, verbose=args.verbose)
     return 0 if result.get("success") else 1
 
 
 def cmd_status(args):
-    from config import load_config, load_state, discover_skills
-    cfg = load_config()
+    from config import OutputBuffer, load_config, load_states, discover_skills
+    with _friendly_errors():
+        cfg = load_config()
+    out = OutputBuffer()
+
+    out.add(f"=== Zo Substrate Status ===")
+    out.add(f"  Identity: {cfg['identity']['name']}")
+    out.add(f"  Partner:  {cfg['partner']['name']}")
+    out.add(f"  Repo:     {cfg['substrate']['repo']}")
+    out.add("")
 
-    print(f"=== Zo Substrate Status ===")
-    print(f"  Identity: {cfg['identity']['name']}")
-    print(f"  Partner:  {cfg['partner']['name']}")
-    print(f"  Repo:     {cfg['substrate']['repo']}")
-    print()
+    states = load_states(cfg, ["last_push.json", "last_pull.json"])
 
-    last_push = load_state(cfg, "last_push.json")
+    last_push = states["last_push.json"]
     if last_push:
-        print(f"Last push: {last_push.get('last_push', 'never')}")
+        out.add(f"Last push: {last_push.get('last_push', 'never')}")
         pushed = last_push.get("pushed_skills", [])
-        print(f"  Skills: {', '.join(pushed) if pushed else 'none'}")
+        out.add(f"  Skills: {', '.join(pushed) if pushed else 'none'}")
     else:
-        print("Last push: never")
+        out.add("Last push: never")
 
-    last_pull = load_state(cfg, "last_pull.json")
+    last_pull = states["last_pull.json"]
     if last_pull:
-        print(f"Last pull: {last_pull.get('last_pull', 'never')}")
+        out.add(f"Last pull: {last_pull.get('last_pull', 'never')}")
         pulled = last_pull.get("pulled_skills", [])
-        print(f"  Skills: {', '.join(pulled) if pulled else 'none'}")
-        print(f"  Source: {last_pull.get('source', 'unknown')}")
+        out.add(f"  Skills: {', '.join(pulled) if pulled else 'none'}")
+        out.add(f"  Source: {last_pull.get('source', 'unknown')}")
     else:
-        print("Last pull: never")
+        out.add("Last pull: never")
 
-    print()
+    out.add("")
     skills = discover_skills(cfg)
-    print(f"Discoverable skills: {len(skills)}")
+    out.add(f"Discoverable skills: {len(skills)}")
     for s in skills:
-        print(f"  - {s['name']}")
+        out.add(f"  - {s['name']}")
 
+    out.flush()
     return 0
 
 
 def cmd_setup(args):
     from setup import main as setup_main
     sys.argv = ["setup"] + args.setup_args
-    setup_main()
+    with _friendly_errors():  # loads the config itself
+        setup_main()
     return 0
 
 
 def cmd_bundle(args):
     from bundle import main as bundle_main
     sys.argv = ["bundle"] + args.bundle_args
-    bundle_main()
+    with _friendly_errors():  # loads the config itself
+        bundle_main()
     return 0
 
 
 def cmd_context(args):
     from context import main as context_main
     sys.argv = ["context"] + args.context_args
-    context_main()
+    with _friendly_errors():  # loads the config itself
+        context_main()
     return 0
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Zo Substrate — Zo-to-Zo skill exchange",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__,
-    )
-    sub = parser.add_subparsers(dest="command")
-
-    # push
+def _add_push(sub):
     p = sub.add_parser("push", help="Push skills to substrate repo")
     p.add_argument("--skills", help="Comma-separated skill slugs (default: all)")
     p.add_argument("--dry-run", action="store_true")
 
-    # pull
+
+def _add_pull(sub):
     pl = sub.add_parser("pull", help="Pull skills from substrate repo")
     pl.add_argument("--skills", help="Comma-separated skill slugs (default: all)")
     pl.add_argument("--dry-run", action="store_true")
     pl.add_argument("--verbose", action="store_true")
 
-    # status
+
+def _add_status(sub):
     sub.add_parser("status", help="Show sync status")
 
-    # setup (pass-through)
+
+def _add_setup(sub):
     s = sub.add_parser("setup", help="Setup and configuration")
     s.add_argument("setup_args", nargs=argparse.REMAINDER, default=[])
 
-    # bundle (pass-through)
+
+def _add_bundle(sub):
     b = sub.add_parser("bundle", help="Skill bundling and validation")
     b.add_argument("bundle_args", nargs=argparse.REMAINDER, default=[])
 
-    # context (pass-through)
+
+def _add_context(sub):
     c = sub.add_parser("context", help="Local context awareness")
     c.add_argument("context_args", nargs=argparse.REMAINDER, default=[])
 
+
+# Subparser builders, so main() only constructs the one being run
+SUBCMDS = {
+    "push": _add_push,
+    "pull": _add_pull,
+    "status": _add_status,
+    "setup": _add_setup,
+    "bundle": _add_bundle,
+    "context": _add_context,
+}
+
+
+def _first_command(argv):
+    """Return the requested subcommand, or None if top-level help comes first."""
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def main():
+    command = _first_command(sys.argv[1:])
+    if command in SUBCMDS:
+        # Known subcommand: top-level help can't be shown, so skip its formatter
+        parser = argparse.ArgumentParser(add_help=False)
+        sub = parser.add_subparsers(dest="command")
+        SUBCMDS[command](sub)
+    else:
+        # Help, no args or an unknown command: build everything for the listing
+        parser = argparse.ArgumentParser(
+            description="Zo Substrate — Zo-to-Zo skill exchange",
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=__doc__,
+        )
+        sub = parser.add_subparsers(dest="command")
+        for add in SUBCMDS.values():
+            add(sub)
+
     args = parser.parse_args()
 
     handlers = {
@@ -148,17 +211,7 @@ def main():
     }
 
     if args.command in handlers:
-        try:
-            sys.exit(handlers[args.command](args))
-        except FileNotFoundError as e:
-            print(f"Config error: {e}")
-            sys.exit(1)
-        except ValueError as e:
-            print(f"Validation error: {e}")
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error: {e}")
-            sys.exit(1)
+        sys.exit(handlers[args.command](args))
     else:
         parser.print_help()
         sys.exit(1)
@@ -12,54 +12,92 @@ Requires:
     ZO_CLIENT_IDENTITY_TOKEN environment variable (auto-set on Zo)
 """
 
+import json
 import os
+import re
+import socket
 import sys
+import time
+import urllib.error
+import urllib.request
+
+# Three base64url segments; catches a mangled token before a 30s round trip
+_JWT_RE = re.compile(r"^(?:Bearer )?[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+$")
+
+# Transient gateway errors worth one more attempt
+RETRY_STATUSES = (502, 503, 504)
+RETRY_DELAY = 2
+
+
+def _post(req) -> tuple:
+    """Send the request; returns (status, body), with HTTP errors as statuses."""
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _is_timeout(e: Exception) -> bool:
+    if isinstance(e, urllib.error.URLError):
+        e = e.reason
+    return isinstance(e, (socket.timeout, TimeoutError))
+
 
 def prime_window() -> int:
     """Make a trivial Opus request to start the 5-hour window."""
-    
-    # Import here to fail gracefully if requests not installed
-    try:
-        import requests
-    except ImportError:
-        print("ERROR: requests library required. Run: pip install requests")
-        return 1
-    
+
     token = os.environ.get("ZO_CLIENT_IDENTITY_TOKEN")
     if not token:
         print("ERROR: ZO_CLIENT_IDENTITY_TOKEN not set")
         print("This script must run on Zo Computer.")
         return 1
-    
-    try:
-        response = requests.post(
-            "https://api.zo.computer/zo/ask",
-            headers={
-                "authorization": token,
-                "content-type": "application/json"
-            },
-            json={
-                "input": "Return either 0 or 1 at random. Nothing else.",
-                "model_name": "claude-opus-4-5-20251101"
-            },
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            result = response.json().get("output", "").strip()
-            print(f"Window primed. Opus returned: {result}")
-            return 0
-        else:
-            print(f"ERROR: {response.status_code} - {response.text}")
-            return 1
-            
-    except requests.exceptions.Timeout:
-        print("ERROR: Request timed out")
-        return 1
-    except requests.exceptions.RequestException as e:
-        print(f"ERROR: Request failed - {e}")
+    if not _JWT_RE.match(token.strip()):
+        print("ERROR: ZO_CLIENT_IDENTITY_TOKEN is not a well-formed token")
         return 1
 
+    # One stdlib POST; no need to import requests for it
+    req = urllib.request.Request(
+        "https://api.zo.computer/zo/ask",
+        data=json.dumps({
+            "input": "Return either 0 or 1 at random. Nothing else.",
+            "model_name": "claude-opus-4-5-20251101"
+        }).encode("utf-8"),
+        headers={
+            "authorization": token,
+            "content-type": "application/json"
+        },
+        method="POST",
+    )
+
+    for attempt in range(2):
+        retry = attempt == 0
+        try:
+            status, body = _post(req)
+        except OSError as e:  # URLError and socket timeouts included
+            if _is_timeout(e):
+                if retry:
+                    time.sleep(RETRY_DELAY)
+                    continue
+                print("ERROR: Request timed out")
+            else:
+                print(f"ERROR: Request failed - {getattr(e, 'reason', e)}")
+            return 1
+
+        if status in RETRY_STATUSES and retry:
+            time.sleep(RETRY_DELAY)
+            continue
+        if status != 200:
+            print(f"ERROR: {status} - {body.decode('utf-8', 'replace')}")
+            return 1
+        try:
+            result = json.loads(body).get("output", "").strip()
+        except (ValueError, AttributeError) as e:
+            print(f"ERROR: Unexpected response - {e}")
+            return 1
+        print(f"Window primed. Opus returned: {result}")
+        return 0
+
 
 def main():
     if "--help" in sys.argv or "-h" in sys.argv:
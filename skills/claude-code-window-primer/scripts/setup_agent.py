@@ -4,19 +4,55 @@ Set up the scheduled agent for Claude Code window priming.
 Runs daily at 6:30am ET.
 """
 
+import io
+import os
+import runpy
 import subprocess
 import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
 
-def main():
-    # Check for existing agent first
+CONFLICT_GATE = "/home/workspace/N5/scripts/agent_conflict_gate.py"
+CONFLICT_GATE_ARGS = ["--summary", "--no-cache"]
+
+
+def run_conflict_gate():
+    """Run the agent conflict gate in-process; returns (stdout, stderr)."""
+    if os.path.isfile(CONFLICT_GATE):
+        out, err = io.StringIO(), io.StringIO()
+        saved_argv, saved_path = sys.argv, list(sys.path)
+        sys.argv = [CONFLICT_GATE] + CONFLICT_GATE_ARGS
+        sys.path.insert(0, os.path.dirname(CONFLICT_GATE))
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                runpy.run_path(CONFLICT_GATE, run_name="__main__")
+        except SystemExit:
+            pass
+        except ImportError:
+            out = None
+        except Exception:
+            # Report like a failed child process would, not as our own crash
+            traceback.print_exc(file=err)
+        finally:
+            sys.argv, sys.path[:] = saved_argv, saved_path
+        if out is not None:
+            return out.getvalue(), err.getvalue()
+
+    # Missing script or its imports don't resolve here: use a separate interpreter
     result = subprocess.run(
-        ["python3", "/home/workspace/N5/scripts/agent_conflict_gate.py", "--summary", "--no-cache"],
+        ["python3", CONFLICT_GATE] + CONFLICT_GATE_ARGS,
         capture_output=True,
         text=True
     )
-    print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+    return result.stdout, result.stderr
+
+
+def main():
+    # Check for existing agent first
+    stdout, stderr = run_conflict_gate()
+    print(stdout)
+    if stderr:
+        print(stderr, file=sys.stderr)
     
     print("\nTo create the agent, run this in a Zo conversation:")
     print("""